@@ -12,7 +12,7 @@ Data source: https://www.sudokuonline.io (pages embed a `preloadedPuzzles` array
 
 Commands:
   - list
-  - get <preset> [--count N] [--id ID] [--render] [--json]
+  - get <preset> [--count N] [--id ID] [--refetch] [--render] [--json]
   - render [--latest|--id ID] [--pdf|--printable] [--json]
   - html [--latest|--id ID] [--json]
   - reveal [--latest|--id ID] [--full|--box ...|--cell r c] [--image] [--json]
@@ -24,20 +24,31 @@ Notes:
 
 from __future__ import annotations
 
-import argparse
+import functools
 import json
 import math
 import os
 import random
 import re
 import sys
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import requests
-from PIL import Image
+# requests, Pillow and the PDF renderer are imported where they are used, so commands
+# that don't fetch or draw (list, share, text-mode reveal --cell) start up light.
+if TYPE_CHECKING:
+    import argparse
+
+    import requests
+    from PIL import Image
+
+try:
+    import orjson  # optional: faster parse/serialize of puzzle docs
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None  # type: ignore[assignment]
 
 # Import the existing render + link utilities.
 REPO_ROOT = Path.cwd()
@@ -54,8 +65,6 @@ from sudoku_fetcher import (  # type: ignore
     render_sudoku,
 )
 
-from sudoku_print_render import render_sudoku_a4_pdf  # type: ignore
-
 
 # Storage (workspace-local)
 # Walk up from CWD to find the workspace root (parent of "skills/").
@@ -153,87 +162,101 @@ PRESETS: Dict[str, Preset] = {
 }
 
 
-def utc_stamp() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d_%H%M%SZ")
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-def ensure_dirs() -> None:
-    PUZZLES_DIR.mkdir(parents=True, exist_ok=True)
-    RENDERS_DIR.mkdir(parents=True, exist_ok=True)
+def _json_dumps_doc(doc: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(doc, option=orjson.OPT_INDENT_2)
+    return json.dumps(doc, indent=2, ensure_ascii=False).encode("utf-8")
 
 
-def _extract_js_array_contents(html: str, var_name: str) -> str:
-    marker = f"const {var_name} = ["
-    marker_pos = html.find(marker)
-    if marker_pos < 0:
-        raise ValueError(f"Could not find {var_name} in HTML")
+def _print_json(obj: Dict[str, Any]) -> None:
+    """Print a `--json` result as one line on stdout."""
+    buf = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buf is not None:
+        # orjson emits UTF-8 bytes; hand them to the byte stream without a str round-trip.
+        sys.stdout.flush()
+        buf.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
+        return
+    sys.stdout.write(json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n")
 
-    # Position at the opening '['
-    start = marker_pos + len(marker) - 1
 
-    depth = 0
-    in_string = False
-    string_quote = ""
-    escape = False
+def utc_stamp() -> str:
+    t = time.gmtime()
+    return "%04d-%02d-%02d_%02d%02d%02dZ" % (t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec)
 
-    for i in range(start, len(html)):
-        ch = html[i]
 
-        if in_string:
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
-                continue
-            if ch == string_quote:
-                in_string = False
-            continue
+def ensure_dirs() -> None:
+    PUZZLES_DIR.mkdir(parents=True, exist_ok=True)
+    RENDERS_DIR.mkdir(parents=True, exist_ok=True)
 
-        if ch in ("'", '"'):
-            in_string = True
-            string_quote = ch
-            continue
 
-        if ch == "[":
-            depth += 1
-            continue
+# The page embeds puzzles as `const preloadedPuzzles = [{...}, {...}];` — flat object
+# literals, so a non-nesting object regex over the array slice is sufficient.
+_PRELOADED_MARKER = b"const preloadedPuzzles = ["
+_PRELOADED_END = b"];"
+_OBJ_RE = re.compile(rb"\{[^}]+\}")
+_TRAILING_COMMA_RE = re.compile(rb",(\s*[}\]])")
+# Concurrent batch fetches for `get --count N` once the first batch runs dry.
+_FETCH_WORKERS = 4
+
+
+def parse_preloaded_puzzles(html: bytes) -> List[Dict[str, Any]]:
+    start = html.find(_PRELOADED_MARKER)
+    if start < 0:
+        raise ValueError("Could not find preloadedPuzzles in HTML")
+    start += len(_PRELOADED_MARKER)
+    end = html.find(_PRELOADED_END, start)
+    if end < 0:
+        raise ValueError("Could not parse preloadedPuzzles array from HTML")
+
+    # Entries are JS/Python-ish object literals. JS true/false/null are already spelled
+    # like JSON; only quotes (site uses Python-style 'key': 'value') and trailing commas
+    # need fixing, after which the whole array is parsed in one go.
+    blob = html[start:end].replace(b"'", b'"')
+    try:
+        entries = _json_loads(_TRAILING_COMMA_RE.sub(rb"\1", b"[" + blob + b"]"))
+    except ValueError:
+        # Some entry is not valid JSON — salvage the others one object at a time.
+        entries = []
+        for pm in _OBJ_RE.finditer(blob):
+            try:
+                entries.append(_json_loads(pm.group(0)))
+            except ValueError:
+                continue
 
-        if ch == "]":
-            depth -= 1
-            if depth == 0:
-                return html[start + 1 : i]
+    return [obj for obj in entries if isinstance(obj, dict) and "id" in obj and "data" in obj]
 
-    raise ValueError(f"Could not parse {var_name} array from HTML")
 
+_SESSION: Optional[requests.Session] = None
 
-def parse_preloaded_puzzles(html: str) -> List[Dict[str, Any]]:
-    blob = _extract_js_array_contents(html, "preloadedPuzzles")
-    puzzles: List[Dict[str, Any]] = []
 
-    # Entries are JS/Python-ish object literals — convert to valid JSON and parse safely.
-    for pm in re.finditer(r"\{[^}]+\}", blob):
-        s = pm.group(0)
-        # Fix JS keywords → JSON
-        s = re.sub(r"\btrue\b", "true", s)
-        s = re.sub(r"\bfalse\b", "false", s)
-        s = re.sub(r"\bnull\b", "null", s)
-        # Replace single quotes with double quotes (site uses Python-style 'key': 'value')
-        s = s.replace("'", '"')
-        try:
-            obj = json.loads(s)
-            if isinstance(obj, dict) and "id" in obj and "data" in obj:
-                puzzles.append(obj)
-        except (json.JSONDecodeError, ValueError):
-            continue
+def _http_session() -> requests.Session:
+    """Shared keep-alive session, so repeated batch fetches reuse one connection."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
 
-    return puzzles
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return _SESSION
 
 
 def fetch_puzzles(url: str) -> List[Dict[str, Any]]:
-    r = requests.get(url, timeout=30)
+    # Read the whole body so the connection goes back to the session pool (abandoning a
+    # streamed response closes the socket); parse the raw bytes without a text decode.
+    r = _http_session().get(url, timeout=30)
     r.raise_for_status()
-    return parse_preloaded_puzzles(r.text)
+    return parse_preloaded_puzzles(r.content)
+
+
+# `"picked": {"id": ...}` as laid out by write_puzzle_json (stable key order).
+_PICKED_ID_RE = re.compile(rb'"picked":\s*\{\s*"id":\s*"([^"\\]+)"')
 
 
 def _previously_used_puzzle_ids() -> set[str]:
@@ -241,7 +264,12 @@ def _previously_used_puzzle_ids() -> set[str]:
     used: set[str] = set()
     for path in list_puzzle_jsons():
         try:
-            doc = json.loads(path.read_text(encoding="utf-8"))
+            m = _PICKED_ID_RE.search(path.read_bytes())
+            if m:
+                used.add(m.group(1).decode("utf-8"))
+                continue
+            # Unexpected layout — fall back to a full parse.
+            doc = read_puzzle_doc(path)
             pid = doc.get("picked", {}).get("id")
             if pid:
                 used.add(str(pid))
@@ -306,7 +334,7 @@ def format_cell_value(val: int, letters_mode: bool) -> str:
 
 
 def puzzle_json_filename(stamp: str, preset_key: str, size: int, puzzle_id: str) -> str:
-    short = puzzle_id.split("-")[0]
+    short = puzzle_id.partition("-")[0]
     return f"{stamp}_{preset_key}_{size}x{size}_{short}.json"
 
 
@@ -317,13 +345,44 @@ def write_puzzle_json(doc: Dict[str, Any]) -> Path:
     size = int(doc.get("size", 0) or 0)
     puzzle_id = str(doc.get("picked", {}).get("id", "unknown"))
     path = PUZZLES_DIR / puzzle_json_filename(str(stamp), str(preset_key), size, puzzle_id)
-    path.write_text(json.dumps(doc, indent=2, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(_json_dumps_doc(doc))
+    _puzzle_json_names.cache_clear()
     return path
 
 
-def list_puzzle_jsons() -> List[Path]:
+@functools.lru_cache(maxsize=1)
+def _puzzle_json_names(dir_mtime_ns: int) -> Tuple[str, ...]:
+    # Filenames start with the UTC stamp (YYYY-MM-DD_HHMMSSZ), so name order is
+    # creation order — no per-file stat() needed.
+    with os.scandir(PUZZLES_DIR) as it:
+        names = [e.name for e in it if e.name.endswith(".json")]
+    names.sort()
+    return tuple(names)
+
+
+def _list_puzzle_json_names() -> Tuple[str, ...]:
+    # Keyed on the directory mtime, which changes whenever a puzzle is added or removed.
     ensure_dirs()
-    return sorted(PUZZLES_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    return _puzzle_json_names(PUZZLES_DIR.stat().st_mtime_ns)
+
+
+def list_puzzle_jsons() -> List[Path]:
+    return [PUZZLES_DIR / name for name in _list_puzzle_json_names()]
+
+
+def _puzzle_jsons_with_short_id(sid: str) -> List[Path]:
+    suffix = f"_{sid}.json"
+    return [PUZZLES_DIR / name for name in _list_puzzle_json_names() if name.lower().endswith(suffix)]
+
+
+@functools.lru_cache(maxsize=512)
+def _read_puzzle_doc_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    return _json_loads(Path(path).read_bytes())
+
+
+def read_puzzle_doc(path: Path) -> Dict[str, Any]:
+    """Parse a stored puzzle JSON, reusing earlier parses of the unchanged file."""
+    return _read_puzzle_doc_cached(str(path), path.stat().st_mtime_ns)
 
 
 def latest_puzzle_json() -> Path:
@@ -333,11 +392,14 @@ def latest_puzzle_json() -> Path:
     return files[-1]
 
 
+_ID_FRAGMENT_CHARS = frozenset("0123456789abcdefABCDEF-")
+
+
 def _normalize_id_fragment(value: str) -> str:
     s = str(value or "").strip()
     if not s:
         raise ValueError("Puzzle id cannot be empty")
-    if not re.fullmatch(r"[0-9A-Fa-f-]{1,64}", s):
+    if len(s) > 64 or not _ID_FRAGMENT_CHARS.issuperset(s):
         raise ValueError("Puzzle id may only contain hex characters and '-'")
     return s
 
@@ -345,8 +407,8 @@ def _normalize_id_fragment(value: str) -> str:
 def find_puzzle_json_by_short_id(short_id: str) -> Path:
     """Fast-path lookup by the short ID used in filenames (first UUID segment)."""
     ensure_dirs()
-    sid = _normalize_id_fragment(short_id).split("-")[0].lower()
-    matches = [p for p in list_puzzle_jsons() if p.name.lower().endswith(f"_{sid}.json")]
+    sid = _normalize_id_fragment(short_id).partition("-")[0].lower()
+    matches = _puzzle_jsons_with_short_id(sid)
     if not matches:
         raise FileNotFoundError(f"No stored puzzle JSON found for short id={short_id}")
     return matches[-1]
@@ -359,35 +421,28 @@ def find_puzzle_json_by_id(puzzle_id: str) -> Path:
     - full UUID (e.g. 324306f5-034d-4089-8723-56a8087fde14)
     - short ID (first segment, e.g. 324306f5) which is embedded in the filename
 
-    Fast path: try filename suffix match first; fallback: scan JSON contents.
+    The short ID is always the filename suffix, so only files ending in `_<short>.json`
+    can match; a full UUID is then confirmed against the stored `"id"` field.
     """
 
     normalized = _normalize_id_fragment(puzzle_id)
-    sid = normalized.split("-")[0].lower()
+    sid = normalized.partition("-")[0].lower()
 
-    # Fast path: suffix match on known puzzle JSON filenames (no glob with user input).
-    candidates = [p for p in list_puzzle_jsons() if p.name.lower().endswith(f"_{sid}.json")]
-    if candidates:
-        # If user gave only short id, just return latest match.
-        if "-" not in normalized:
-            return candidates[-1]
+    # Suffix match on known puzzle JSON filenames (no glob with user input).
+    candidates = _puzzle_jsons_with_short_id(sid)
 
-        # If user gave full UUID, verify candidate content before returning.
-        for p in reversed(candidates):
-            try:
-                d = json.loads(p.read_text(encoding="utf-8"))
-                if str(d.get("picked", {}).get("id", "")).lower() == normalized.lower():
-                    return p
-            except Exception:
-                continue
+    # If user gave only short id, just return latest match.
+    if candidates and "-" not in normalized:
+        return candidates[-1]
 
-    # Slow path: scan all stored docs.
-    for p in reversed(list_puzzle_jsons()):
+    # If user gave full UUID, verify candidate content before returning. Docs are written
+    # with a 2-space indent, so a raw byte scan for the id field avoids a full parse.
+    needle = f'"id": "{normalized.lower()}"'.encode("ascii")
+    for p in reversed(candidates):
         try:
-            d = json.loads(p.read_text(encoding="utf-8"))
-            if str(d.get("picked", {}).get("id", "")).lower() == normalized.lower():
+            if needle in p.read_bytes().lower():
                 return p
-        except Exception:
+        except OSError:
             continue
 
     raise FileNotFoundError(f"No stored puzzle JSON found for id={puzzle_id}")
@@ -405,8 +460,7 @@ def load_puzzle_doc(*, puzzle_id: Optional[str] = None, latest: bool = False) ->
     except (ValueError, FileNotFoundError) as e:
         raise SystemExit(str(e))
 
-    doc = json.loads(p.read_text(encoding="utf-8"))
-    return doc, p
+    return read_puzzle_doc(p), p
 
 
 def render_paths(doc: Dict[str, Any], *, kind: str, ext: str = "png") -> Path:
@@ -414,13 +468,13 @@ def render_paths(doc: Dict[str, Any], *, kind: str, ext: str = "png") -> Path:
     stamp = utc_stamp()
     preset_key = doc.get("preset", {}).get("key", "preset")
     size = int(doc.get("size", 0) or 0)
-    puzzle_id_short = str(doc.get("picked", {}).get("id", "unknown")).split("-")[0]
+    puzzle_id_short = str(doc.get("picked", {}).get("id", "unknown")).partition("-")[0]
     return RENDERS_DIR / f"{stamp}_{preset_key}_{size}x{size}_{puzzle_id_short}_{kind}.{ext}"
 
 
 def _print_header(doc: Dict[str, Any]) -> Tuple[str, List[str]]:
     puzzle_id = str(doc.get("picked", {}).get("id", "unknown"))
-    short_id = puzzle_id.split("-")[0]
+    short_id = puzzle_id.partition("-")[0]
 
     preset_key = str(doc.get("preset", {}).get("key", ""))
     size = int(doc.get("size", 0) or 0)
@@ -478,6 +532,8 @@ def render_puzzle_pdf(doc: Dict[str, Any], *, printable: bool = True, dpi: int =
     if printable:
         title_left, right_lines = _print_header(doc)
 
+    from sudoku_print_render import render_sudoku_a4_pdf  # type: ignore
+
     render_sudoku_a4_pdf(
         grid=clues,
         size=size,
@@ -493,68 +549,34 @@ def render_puzzle_pdf(doc: Dict[str, Any], *, printable: bool = True, dpi: int =
     return out
 
 
-def render_puzzle_html(doc: Dict[str, Any]) -> Path:
-    out = render_paths(doc, kind="puzzle", ext="html")
-
-    clues = doc["clues"]
-    size = int(doc["size"])
-    letters_mode = bool(doc.get("preset", {}).get("letters", False))
-    bw, bh = get_block_dims(size)
-
-    def cell_text(v: int) -> str:
-        return format_cell_value(int(v), letters_mode)
-
-    rows: List[str] = []
-    for r in range(size):
-        cells: List[str] = []
-        for c in range(size):
-            v = int(clues[r][c])
-            classes: List[str] = []
-            if c == 0:
-                classes.append("edge-left")
-            if r == 0:
-                classes.append("edge-top")
-            if (c + 1) % bw == 0:
-                classes.append("edge-right-thick")
-            else:
-                classes.append("edge-right")
-            if (r + 1) % bh == 0:
-                classes.append("edge-bottom-thick")
-            else:
-                classes.append("edge-bottom")
-
-            classes_s = " ".join(classes)
-            text = cell_text(v)
-            cells.append(f'<td class="{classes_s}"><span class="cell-value">{text}</span></td>')
-        rows.append("<tr>" + "".join(cells) + "</tr>")
-
-    html = f"""<!doctype html>
-<html lang=\"en\">
+# Static page shell for render_puzzle_html(); only the table rows vary per puzzle.
+_HTML_PREFIX = """<!doctype html>
+<html lang="en">
 <head>
-  <meta charset=\"utf-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>Sudoku</title>
   <style>
-    :root {{
+    :root {
       --cell: 56px;
       --thin: 1px;
       --thick: 3px;
       --line: #444;
       --thick-line: #000;
-    }}
-    body {{
+    }
+    body {
       margin: 0;
       min-height: 100vh;
       display: grid;
       place-items: center;
       background: #fff;
-      font-family: -apple-system, BlinkMacSystemFont, \"Segoe UI\", Roboto, sans-serif;
-    }}
-    table.sudoku {{
+      font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+    }
+    table.sudoku {
       border-collapse: collapse;
       border-spacing: 0;
-    }}
-    table.sudoku td {{
+    }
+    table.sudoku td {
       width: var(--cell);
       height: var(--cell);
       min-width: var(--cell);
@@ -563,8 +585,8 @@ def render_puzzle_html(doc: Dict[str, Any]) -> Path:
       vertical-align: middle;
       box-sizing: border-box;
       padding: 0;
-    }}
-    .cell-value {{
+    }
+    .cell-value {
       width: 100%;
       height: 100%;
       display: grid;
@@ -573,22 +595,58 @@ def render_puzzle_html(doc: Dict[str, Any]) -> Path:
       line-height: 1;
       font-weight: 600;
       color: #111;
-    }}
-    .edge-left {{ border-left: var(--thick) solid var(--thick-line); }}
-    .edge-top {{ border-top: var(--thick) solid var(--thick-line); }}
-    .edge-right {{ border-right: var(--thin) solid var(--line); }}
-    .edge-bottom {{ border-bottom: var(--thin) solid var(--line); }}
-    .edge-right-thick {{ border-right: var(--thick) solid var(--thick-line); }}
-    .edge-bottom-thick {{ border-bottom: var(--thick) solid var(--thick-line); }}
+    }
+    .edge-left { border-left: var(--thick) solid var(--thick-line); }
+    .edge-top { border-top: var(--thick) solid var(--thick-line); }
+    .edge-right { border-right: var(--thin) solid var(--line); }
+    .edge-bottom { border-bottom: var(--thin) solid var(--line); }
+    .edge-right-thick { border-right: var(--thick) solid var(--thick-line); }
+    .edge-bottom-thick { border-bottom: var(--thick) solid var(--thick-line); }
   </style>
 </head>
 <body>
-  <table class=\"sudoku\" aria-label=\"Sudoku grid\">{''.join(rows)}</table>
+  <table class="sudoku" aria-label="Sudoku grid">"""
+_HTML_SUFFIX = """</table>
 </body>
 </html>
 """
 
-    out.write_text(html, encoding="utf-8")
+
+def render_puzzle_html(doc: Dict[str, Any]) -> Path:
+    out = render_paths(doc, kind="puzzle", ext="html")
+
+    clues = doc["clues"]
+    size = int(doc["size"])
+    letters_mode = bool(doc.get("preset", {}).get("letters", False))
+    bw, bh = get_block_dims(size)
+
+    # Border classes depend only on the row (top/bottom) or the column (left/right),
+    # so build one table per axis; each cell is then two lookups.
+    row_cls = [
+        ("edge-top " if r == 0 else "") + ("edge-bottom-thick" if (r + 1) % bh == 0 else "edge-bottom")
+        for r in range(size)
+    ]
+    col_cls = [
+        ("edge-left " if c == 0 else "") + ("edge-right-thick" if (c + 1) % bw == 0 else "edge-right")
+        for c in range(size)
+    ]
+
+    if letters_mode:
+        texts = [[chr(ord("A") + int(v) - 1) if int(v) else "" for v in row] for row in clues]
+    else:
+        texts = [[str(int(v)) if int(v) else "" for v in row] for row in clues]
+
+    parts: List[str] = [_HTML_PREFIX]
+    for r in range(size):
+        parts.append("<tr>")
+        td_open = '<td class="' + row_cls[r] + " "
+        row_texts = texts[r]
+        for c in range(size):
+            parts.append(td_open + col_cls[c] + '"><span class="cell-value">' + row_texts[c] + "</span></td>")
+        parts.append("</tr>")
+    parts.append(_HTML_SUFFIX)
+
+    out.write_text("".join(parts), encoding="utf-8")
     return out
 
 
@@ -635,6 +693,8 @@ def render_reveal_pdf(doc: Dict[str, Any], *, printable: bool = True, dpi: int =
         t, right_lines = _print_header(doc)
         title_left = f"Solution: {t}"
 
+    from sudoku_print_render import render_sudoku_a4_pdf  # type: ignore
+
     render_sudoku_a4_pdf(
         grid=solution,
         size=size,
@@ -650,6 +710,39 @@ def render_reveal_pdf(doc: Dict[str, Any], *, printable: bool = True, dpi: int =
     return out
 
 
+@functools.lru_cache(maxsize=4)
+def _decoded_image(path: str, mtime_ns: int) -> Image.Image:
+    from PIL import Image
+
+    img = Image.open(path)
+    img.load()  # decode once; later crops are plain memory copies
+    return img
+
+
+def _load_render(image_path: Path) -> Image.Image:
+    """Open a rendered PNG, reusing the decoded pixels if it was already cropped from."""
+    return _decoded_image(str(image_path), image_path.stat().st_mtime_ns)
+
+
+# Extra pixels kept around a cropped box/cell so its border lines stay visible.
+_CROP_PAD = 6
+
+
+@functools.lru_cache(maxsize=None)
+def _box_layout(size: int) -> Tuple[int, int, int, int]:
+    """Return (bw, bh, boxes_per_row, boxes_per_col) for a grid size."""
+    bw, bh = get_block_dims(size)
+    return bw, bh, size // bw, size // bh
+
+
+def _crop_padded(image_path: Path, x0: int, y0: int, x1: int, y1: int, out_path: Path) -> Path:
+    img = _load_render(image_path)
+    pad = _CROP_PAD
+    crop = img.crop((max(0, x0 - pad), max(0, y0 - pad), min(img.width, x1 + pad), min(img.height, y1 + pad)))
+    crop.save(out_path)
+    return out_path
+
+
 def crop_box_image(
     image_path: Path,
     *,
@@ -660,25 +753,13 @@ def crop_box_image(
     margin: int = RENDER_INSET,
     cell_size: int = RENDER_CELL_SIZE,
 ) -> Path:
-    bw, bh = get_block_dims(size)
-
-    br0 = box_r - 1
-    bc0 = box_c - 1
-
-    left = margin
-    top = margin
+    bw, bh, _, _ = _box_layout(size)
+    box_w = bw * cell_size
+    box_h = bh * cell_size
 
-    x0 = left + (bc0 * bw) * cell_size
-    y0 = top + (br0 * bh) * cell_size
-    x1 = x0 + (bw * cell_size)
-    y1 = y0 + (bh * cell_size)
-
-    pad = 6
-
-    img = Image.open(image_path)
-    crop = img.crop((max(0, x0 - pad), max(0, y0 - pad), min(img.width, x1 + pad), min(img.height, y1 + pad)))
-    crop.save(out_path)
-    return out_path
+    x0 = margin + (box_c - 1) * box_w
+    y0 = margin + (box_r - 1) * box_h
+    return _crop_padded(image_path, x0, y0, x0 + box_w, y0 + box_h, out_path)
 
 
 def crop_cell_image(
@@ -690,23 +771,9 @@ def crop_cell_image(
     margin: int = RENDER_INSET,
     cell_size: int = RENDER_CELL_SIZE,
 ) -> Path:
-    rr0 = r - 1
-    cc0 = c - 1
-
-    left = margin
-    top = margin
-
-    x0 = left + cc0 * cell_size
-    y0 = top + rr0 * cell_size
-    x1 = x0 + cell_size
-    y1 = y0 + cell_size
-
-    pad = 6
-
-    img = Image.open(image_path)
-    crop = img.crop((max(0, x0 - pad), max(0, y0 - pad), min(img.width, x1 + pad), min(img.height, y1 + pad)))
-    crop.save(out_path)
-    return out_path
+    x0 = margin + (c - 1) * cell_size
+    y0 = margin + (r - 1) * cell_size
+    return _crop_padded(image_path, x0, y0, x0 + cell_size, y0 + cell_size, out_path)
 
 
 def cmd_list(args: argparse.Namespace) -> int:
@@ -716,7 +783,7 @@ def cmd_list(args: argparse.Namespace) -> int:
         items.append({"preset": p.key, "desc": p.desc, "letters": p.letters, "url": p.url})
 
     if args.json:
-        print(json.dumps({"presets": items}, ensure_ascii=False))
+        _print_json({"presets": items})
     else:
         for it in items:
             print(f"- {it['preset']}: {it['desc']}\n  {it['url']}")
@@ -724,6 +791,50 @@ def cmd_list(args: argparse.Namespace) -> int:
     return 0
 
 
+def _find_stored_puzzle(preset_key: str, id_fragment: str) -> Optional[Tuple[Dict[str, Any], Path]]:
+    """Return the stored doc for `get --id` if that puzzle was already fetched for this preset."""
+    try:
+        fragment = _normalize_id_fragment(id_fragment).lower()
+        candidates = _puzzle_jsons_with_short_id(fragment.partition("-")[0])
+    except (ValueError, OSError):
+        return None
+
+    # The same short id may be stored under several presets; newest match for this one wins.
+    for path in reversed(candidates):
+        try:
+            doc = read_puzzle_doc(path)
+        except (ValueError, OSError):
+            continue
+        pid = str(doc.get("picked", {}).get("id", "")).lower()
+        if doc.get("preset", {}).get("key") == preset_key and fragment in pid:
+            return doc, path
+    return None
+
+
+def _get_item(doc: Dict[str, Any], json_path: Path, *, render: bool) -> Dict[str, Any]:
+    preset = doc["preset"]
+    picked = doc["picked"]
+    share = doc.get("share", {})
+
+    item: Dict[str, Any] = {
+        "preset": preset["key"],
+        "desc": preset["desc"],
+        "puzzle_id": picked["id"],
+        "picked_index": picked["index"],
+        "puzzle_count": picked["total"],
+        "size": doc["size"],
+        "letters_mode": preset["letters"],
+        "puzzle_json": str(json_path),
+        "share_kind": share.get("kind", "none"),
+        "share_link": share.get("link"),
+    }
+
+    if render:
+        item["puzzle_image"] = str(render_puzzle_image(doc, printable=False))
+
+    return item
+
+
 def cmd_get(args: argparse.Namespace) -> int:
     if args.preset not in PRESETS:
         raise SystemExit(f"Unknown preset '{args.preset}'. Run: sudoku.py list")
@@ -740,8 +851,20 @@ def cmd_get(args: argparse.Namespace) -> int:
     preset = PRESETS[args.preset]
 
     selected: List[Tuple[Dict[str, Any], int, int]] = []  # (puzzle, picked_idx, batch_total)
+    items: List[Dict[str, Any]] = []
 
-    if count == 1:
+    # A puzzle selected by --id may already be stored — serve it without any network.
+    stored = None
+    if has_id_selector and not args.refetch:
+        stored = _find_stored_puzzle(preset.key, args.id)
+
+    if stored is not None:
+        # Re-store under a fresh stamp so the puzzle just handed out is the "latest" one,
+        # exactly as if it had been fetched again.
+        doc = dict(stored[0], created_utc=utc_stamp())
+        json_path = write_puzzle_json(doc)
+        items.append(_get_item(doc, json_path, render=args.render))
+    elif count == 1:
         puzzles = fetch_puzzles(preset.url)
         try:
             puzzle, picked_idx = pick_puzzle(puzzles, puzzle_id=args.id)
@@ -749,38 +872,51 @@ def cmd_get(args: argparse.Namespace) -> int:
             raise SystemExit(str(e))
         selected.append((puzzle, picked_idx, len(puzzles)))
     else:
+        from concurrent.futures import ThreadPoolExecutor
+
         used_ids = _previously_used_puzzle_ids()
         seen_ids: set[str] = set()
         attempts = 0
         max_attempts = max(5, count * 4)
-
-        while len(selected) < count and attempts < max_attempts:
-            attempts += 1
-            puzzles = fetch_puzzles(preset.url)
-
-            fresh = [
-                (p, i, len(puzzles))
-                for i, p in enumerate(puzzles)
-                if str(p.get("id")) not in used_ids and str(p.get("id")) not in seen_ids
-            ]
-
-            if not fresh:
-                continue
-
-            random.shuffle(fresh)
-            needed = count - len(selected)
-            for p, i, total in fresh[:needed]:
-                pid = str(p.get("id"))
-                seen_ids.add(pid)
-                selected.append((p, i, total))
+        n = 1  # batches in the current round; one is usually enough
+
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+            while len(selected) < count and attempts < max_attempts:
+                n = min(n, max_attempts - attempts)
+                attempts += n
+                before = len(selected)
+
+                for puzzles in pool.map(fetch_puzzles, [preset.url] * n):
+                    fresh = [
+                        (p, i, len(puzzles))
+                        for i, p in enumerate(puzzles)
+                        if str(p.get("id")) not in used_ids and str(p.get("id")) not in seen_ids
+                    ]
+
+                    if not fresh:
+                        continue
+
+                    random.shuffle(fresh)
+                    needed = count - len(selected)
+                    for p, i, total in fresh[:needed]:
+                        pid = str(p.get("id"))
+                        seen_ids.add(pid)
+                        selected.append((p, i, total))
+
+                # Size the next (parallel) round by the shortfall and what the last round
+                # yielded per batch, so the site isn't hit with batches we won't need.
+                gained = len(selected) - before
+                shortfall = count - len(selected)
+                if gained:
+                    n = min(_FETCH_WORKERS, math.ceil(shortfall * n / gained))
+                else:
+                    n = _FETCH_WORKERS
 
         if len(selected) < count:
             raise SystemExit(
                 f"Could only fetch {len(selected)} unique new puzzle(s) after {attempts} batch fetches (requested {count})."
             )
 
-    items: List[Dict[str, Any]] = []
-
     for puzzle, picked_idx, batch_total in selected:
         size, clues, solution = decode_puzzle(puzzle["data"])
 
@@ -791,7 +927,7 @@ def cmd_get(args: argparse.Namespace) -> int:
         share_kind = "none"
         share_link = None
         if size == 9:
-            short_id = puzzle_id.split("-")[0]
+            short_id = puzzle_id.partition("-")[0]
             # Oliver preference: embedded SudokuPad metadata title format
             # "Easy Classic [ID]"
             difficulty = preset.key.replace("9", "").capitalize()  # easy/medium/hard/evil
@@ -819,29 +955,12 @@ def cmd_get(args: argparse.Namespace) -> int:
         }
 
         json_path = write_puzzle_json(doc)
-
-        item: Dict[str, Any] = {
-            "preset": preset.key,
-            "desc": preset.desc,
-            "puzzle_id": puzzle_id,
-            "picked_index": picked_idx,
-            "puzzle_count": batch_total,
-            "size": size,
-            "letters_mode": preset.letters,
-            "puzzle_json": str(json_path),
-            "share_kind": share_kind,
-            "share_link": share_link,
-        }
-
-        if args.render:
-            item["puzzle_image"] = str(render_puzzle_image(doc, printable=False))
-
-        items.append(item)
+        items.append(_get_item(doc, json_path, render=args.render))
 
     if count == 1:
         payload: Dict[str, Any] = items[0]
         if args.json:
-            print(json.dumps(payload, ensure_ascii=False))
+            _print_json(payload)
         else:
             print(f"Stored: {payload['puzzle_json']}")
             if payload.get("puzzle_image"):
@@ -860,7 +979,7 @@ def cmd_get(args: argparse.Namespace) -> int:
     }
 
     if args.json:
-        print(json.dumps(payload_multi, ensure_ascii=False))
+        _print_json(payload_multi)
     else:
         print(f"Stored {len(items)} puzzle(s):")
         for it in items:
@@ -874,61 +993,67 @@ def cmd_render(args: argparse.Namespace) -> int:
 
     if args.pdf:
         # PDF is primarily for printing; we include the small header by default.
-        out_path = render_puzzle_pdf(doc, printable=True)
-        out = {"puzzle_json": str(json_path), "puzzle_pdf": str(out_path)}
+        out_path_s = str(render_puzzle_pdf(doc, printable=True))
+        out = {"puzzle_json": str(json_path), "puzzle_pdf": out_path_s}
     else:
-        img = render_puzzle_image(doc, printable=args.printable)
-        out = {"puzzle_json": str(json_path), "puzzle_image": str(img)}
+        out_path_s = str(render_puzzle_image(doc, printable=args.printable))
+        out = {"puzzle_json": str(json_path), "puzzle_image": out_path_s}
 
     if args.json:
-        print(json.dumps(out, ensure_ascii=False))
+        _print_json(out)
     else:
-        print(str(list(out.values())[-1]))
+        print(out_path_s)
     return 0
 
 
 def cmd_html(args: argparse.Namespace) -> int:
     doc, json_path = load_puzzle_doc(puzzle_id=args.id, latest=args.latest)
-    html = render_puzzle_html(doc)
-    out = {"puzzle_json": str(json_path), "puzzle_html": str(html)}
+    html_s = str(render_puzzle_html(doc))
+    out = {"puzzle_json": str(json_path), "puzzle_html": html_s}
 
     if args.json:
-        print(json.dumps(out, ensure_ascii=False))
+        _print_json(out)
     else:
-        print(str(html))
+        print(html_s)
     return 0
 
 
+def _sudokupad_link(clues: Any, size: int, title: str) -> str:
+    link = generate_native_link(clues, size, title=title)
+    # The native /puzzle/ format is 9x9-only; other sizes go through SCL.
+    if size != 9 and not link.startswith("http"):
+        link = generate_scl_link(clues, size, title=title)
+    return link
+
+
+# `share --type` value -> link builder. _SHARE_TYPES keeps the order for --help.
+_SHARE_LINK_BUILDERS = {
+    "sudokupad": _sudokupad_link,
+    "fpuzzle": generate_fpuzzles_link,
+    "scl": generate_scl_link,
+}
+_SHARE_TYPES = tuple(_SHARE_LINK_BUILDERS)
+
+
 def cmd_share(args: argparse.Namespace) -> int:
     doc, json_path = load_puzzle_doc(puzzle_id=args.id, latest=args.latest)
     
     clues = doc["clues"]
     size = int(doc["size"])
     puzzle_id = str(doc.get("picked", {}).get("id", "unknown"))
-    short_id = puzzle_id.split("-")[0]
+    short_id = puzzle_id.partition("-")[0]
     
     preset_key = str(doc.get("preset", {}).get("key", ""))
     difficulty = preset_key.replace("9", "").capitalize() or "Easy"
     
     title = f"{difficulty} Classic [{short_id}]"
     
-    link = None
-    if args.type == "scl":
-        link = generate_scl_link(clues, size, title=title)
-    elif args.type == "fpuzzle":
-        link = generate_fpuzzles_link(clues, size, title=title)
-    else: # sudokupad
-        if size == 9:
-            link = generate_native_link(clues, size, title=title)
-        else:
-            link = generate_native_link(clues, size, title=title)
-            if not link.startswith("http"):
-                 link = generate_scl_link(clues, size, title=title)
+    link = _SHARE_LINK_BUILDERS[args.type](clues, size, title=title)
 
     out = {"puzzle_json": str(json_path), "share_link": link, "type": args.type}
     
     if args.json:
-        print(json.dumps(out, ensure_ascii=False))
+        _print_json(out)
     else:
         print(link)
     return 0
@@ -944,28 +1069,27 @@ def cmd_reveal(args: argparse.Namespace) -> int:
     want_full = bool(args.full) or (args.box is None and args.cell is None)
 
     if args.pdf and want_full:
-        pdf = render_reveal_pdf(doc, printable=True)
-        out = {"puzzle_json": str(json_path), "solution_pdf": str(pdf)}
+        pdf_s = str(render_reveal_pdf(doc, printable=True))
+        out = {"puzzle_json": str(json_path), "solution_pdf": pdf_s}
         if args.json:
-            print(json.dumps(out, ensure_ascii=False))
+            _print_json(out)
         else:
-            print(str(pdf))
+            print(pdf_s)
         return 0
 
-    reveal_img = render_reveal_image(doc, printable=args.printable)
-
+    # The full solution image is rendered only by the branches that need it, so a
+    # text-only `--cell` lookup never touches Pillow or the disk.
     if want_full:
-        out = {"puzzle_json": str(json_path), "solution_image": str(reveal_img)}
+        reveal_img_s = str(render_reveal_image(doc, printable=args.printable))
+        out = {"puzzle_json": str(json_path), "solution_image": reveal_img_s}
         if args.json:
-            print(json.dumps(out, ensure_ascii=False))
+            _print_json(out)
         else:
-            print(str(reveal_img))
+            print(reveal_img_s)
         return 0
 
     if args.box is not None:
-        bw, bh = get_block_dims(size)
-        boxes_per_row = size // bw
-        boxes_per_col = size // bh
+        _, _, boxes_per_row, boxes_per_col = _box_layout(size)
         total_boxes = boxes_per_row * boxes_per_col
 
         vals = args.box
@@ -973,8 +1097,8 @@ def cmd_reveal(args: argparse.Namespace) -> int:
             idx = vals[0]
             if not (1 <= idx <= total_boxes):
                 raise ValueError(f"box index out of range: {idx} (1..{total_boxes})")
-            box_r = (idx - 1) // boxes_per_row + 1
-            box_c = (idx - 1) % boxes_per_row + 1
+            box_r0, box_c0 = divmod(idx - 1, boxes_per_row)
+            box_r, box_c = box_r0 + 1, box_c0 + 1
         elif len(vals) == 2:
             box_r, box_c = vals
             if not (1 <= box_r <= boxes_per_col and 1 <= box_c <= boxes_per_row):
@@ -985,14 +1109,16 @@ def cmd_reveal(args: argparse.Namespace) -> int:
         else:
             raise ValueError("--box expects either 1 value (index) or 2 values (row col)")
 
+        reveal_img = render_reveal_image(doc, printable=args.printable)
         out_path = render_paths(doc, kind=f"box_{idx}_r{box_r}_c{box_c}")
         crop_box_image(reveal_img, size=size, box_r=box_r, box_c=box_c, out_path=out_path)
 
-        out = {"puzzle_json": str(json_path), "box": {"index": idx, "r": box_r, "c": box_c}, "image": str(out_path)}
+        out_path_s = str(out_path)
+        out = {"puzzle_json": str(json_path), "box": {"index": idx, "r": box_r, "c": box_c}, "image": out_path_s}
         if args.json:
-            print(json.dumps(out, ensure_ascii=False))
+            _print_json(out)
         else:
-            print(str(out_path))
+            print(out_path_s)
         return 0
 
     if args.cell is not None:
@@ -1003,71 +1129,79 @@ def cmd_reveal(args: argparse.Namespace) -> int:
         val = int(doc["solution"][r - 1][c - 1])
         text = format_cell_value(val, letters_mode)
 
-        cell_img_path: Optional[Path] = None
+        cell_img_path_s: Optional[str] = None
         if args.image:
+            reveal_img = render_reveal_image(doc, printable=args.printable)
             cell_img_path = render_paths(doc, kind=f"cell_r{r}_c{c}")
             crop_cell_image(reveal_img, r=r, c=c, out_path=cell_img_path)
+            cell_img_path_s = str(cell_img_path)
 
         if args.json:
             out: Dict[str, Any] = {"puzzle_json": str(json_path), "cell": {"r": r, "c": c}, "value": val, "text": text}
-            if cell_img_path:
-                out["image"] = str(cell_img_path)
-            print(json.dumps(out, ensure_ascii=False))
+            if cell_img_path_s:
+                out["image"] = cell_img_path_s
+            _print_json(out)
         else:
             # requirement: output just the digit/letter
-            print(text)
-            if cell_img_path:
-                print(str(cell_img_path))
+            # (sys.stdout is looked up per call so redirected/captured stdout still works)
+            if cell_img_path_s:
+                sys.stdout.write(f"{text}\n{cell_img_path_s}\n")
+            else:
+                sys.stdout.write(text + "\n")
         return 0
 
     raise SystemExit("Nothing to reveal")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(prog="sudoku.py")
-    sub = p.add_subparsers(dest="cmd", required=True)
+def _finish_subparser(sp: Any, func: Any) -> None:
+    # Shared tail of every subparser: `--text` toggles JSON off, and the handler.
+    sp.add_argument("--text", dest="json", action="store_false", help="Output text instead of JSON")
+    sp.set_defaults(json=True, func=func)
+
 
+def _build_list(sub: Any) -> None:
     p_list = sub.add_parser("list", help="List available presets")
-    p_list.add_argument("--text", dest="json", action="store_false", help="Output text instead of JSON")
-    p_list.set_defaults(json=True)
-    p_list.set_defaults(func=cmd_list)
+    _finish_subparser(p_list, cmd_list)
+
 
+def _build_get(sub: Any) -> None:
     p_get = sub.add_parser("get", help="Fetch a puzzle from a preset and store as JSON")
     p_get.add_argument("preset", help="Preset name (see: list)")
     p_get.add_argument("--count", type=int, default=1, help="Fetch and store N puzzles (default: 1)")
     p_get.add_argument("--id", help="Select puzzle by unique ID fragment (matches any part of source UUID)")
     p_get.add_argument("--render", action="store_true", help="Also render the puzzle image now")
-    p_get.add_argument("--text", dest="json", action="store_false", help="Output text instead of JSON")
-    p_get.set_defaults(json=True)
-    p_get.set_defaults(func=cmd_get)
+    p_get.add_argument("--refetch", action="store_true", help="With --id: fetch from the source even if already stored")
+    _finish_subparser(p_get, cmd_get)
 
+
+def _build_render(sub: Any) -> None:
     p_ren = sub.add_parser("render", help="Render puzzle image from stored JSON")
     g = p_ren.add_mutually_exclusive_group(required=False)
     g.add_argument("--latest", action="store_true", help="Use latest stored puzzle (default)")
     g.add_argument("--id", help="Puzzle ID (full UUID or short 8-char ID from filename)")
     p_ren.add_argument("--printable", action="store_true", help="Include small header (difficulty + short ID) for printout")
     p_ren.add_argument("--pdf", action="store_true", help="Render as A4 PDF (recommended for printing)")
-    p_ren.add_argument("--text", dest="json", action="store_false", help="Output text instead of JSON")
-    p_ren.set_defaults(json=True)
-    p_ren.set_defaults(func=cmd_render)
+    _finish_subparser(p_ren, cmd_render)
+
 
+def _build_html(sub: Any) -> None:
     p_html = sub.add_parser("html", help="Render puzzle as minimal HTML")
     g_html = p_html.add_mutually_exclusive_group(required=False)
     g_html.add_argument("--latest", action="store_true", help="Use latest stored puzzle (default)")
     g_html.add_argument("--id", help="Puzzle ID (full UUID or short 8-char ID from filename)")
-    p_html.add_argument("--text", dest="json", action="store_false", help="Output text instead of JSON")
-    p_html.set_defaults(json=True)
-    p_html.set_defaults(func=cmd_html)
+    _finish_subparser(p_html, cmd_html)
+
 
+def _build_share(sub: Any) -> None:
     p_share = sub.add_parser("share", help="Generate share link")
     g_share = p_share.add_mutually_exclusive_group(required=False)
     g_share.add_argument("--latest", action="store_true", help="Use latest stored puzzle (default)")
     g_share.add_argument("--id", help="Puzzle ID (full UUID or short 8-char ID from filename)")
-    p_share.add_argument("--type", choices=["sudokupad", "fpuzzle", "scl"], default="sudokupad", help="Link type")
-    p_share.add_argument("--text", dest="json", action="store_false", help="Output text instead of JSON")
-    p_share.set_defaults(json=True)
-    p_share.set_defaults(func=cmd_share)
+    p_share.add_argument("--type", choices=_SHARE_TYPES, default="sudokupad", help="Link type")
+    _finish_subparser(p_share, cmd_share)
 
+
+def _build_reveal(sub: Any) -> None:
     p_rev = sub.add_parser("reveal", help="Reveal solution from stored JSON (full/box/cell)")
     g2 = p_rev.add_mutually_exclusive_group(required=False)
     g2.add_argument("--latest", action="store_true", help="Use latest stored puzzle (default)")
@@ -1081,17 +1215,134 @@ def build_parser() -> argparse.ArgumentParser:
     sel.add_argument("--cell", type=int, nargs=2, metavar=("ROW", "COL"), help="Reveal a single cell value: '--cell <row> <col>' (1-based)")
 
     p_rev.add_argument("--image", action="store_true", help="With --cell: also write a tiny 1-cell image")
-    p_rev.add_argument("--text", dest="json", action="store_false", help="Output text instead of JSON")
-    p_rev.set_defaults(json=True)
-    p_rev.set_defaults(func=cmd_reveal)
+    _finish_subparser(p_rev, cmd_reveal)
+
+
+# Subcommand name -> builder, in help-listing order.
+_SUBCOMMAND_BUILDERS = {
+    "list": _build_list,
+    "get": _build_get,
+    "render": _build_render,
+    "html": _build_html,
+    "share": _build_share,
+    "reveal": _build_reveal,
+}
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    # The top-level parser takes no options besides -h, so a valid command line
+    # always starts with the subcommand name.
+    if argv and argv[0] in _SUBCOMMAND_BUILDERS:
+        return argv[0]
+    return None
+
+
+# Fast-pathed subcommands -> options they accept and the attribute defaults argparse
+# would set. Anything outside these (help, typos, abbreviations, `--opt=value`) goes
+# through argparse instead.
+_FAST_FLAGS: Dict[str, frozenset] = {
+    "list": frozenset({"--text"}),
+    "share": frozenset({"--latest", "--id", "--type", "--text"}),
+    "reveal": frozenset({"--latest", "--id", "--printable", "--pdf", "--full", "--box", "--cell", "--image", "--text"}),
+}
+_FAST_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "list": {"json": True},
+    "share": {"latest": False, "id": None, "type": "sudokupad", "json": True},
+    "reveal": {
+        "latest": False,
+        "id": None,
+        "printable": False,
+        "pdf": False,
+        "full": False,
+        "box": None,
+        "cell": None,
+        "image": False,
+        "json": True,
+    },
+}
+_FAST_EXCLUSIVE = (("--latest", "--id"), ("--full", "--box", "--cell"))
+
+
+def _fastpath(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse common `list` / `share` / `reveal` command lines without argparse.
+
+    Returns None for anything not understood exactly (including repeated or
+    conflicting options), so argparse can parse it or report the error.
+    """
+    if not argv or argv[0] not in _FAST_FLAGS:
+        return None
+    cmd = argv[0]
+    allowed = _FAST_FLAGS[cmd]
+    ns = dict(_FAST_DEFAULTS[cmd])
+    seen = set()
+
+    i, n = 1, len(argv)
+    while i < n:
+        tok = argv[i]
+        i += 1
+        if tok not in allowed or tok in seen:
+            return None
+        seen.add(tok)
+        if tok == "--text":
+            ns["json"] = False
+        elif tok in ("--id", "--type"):
+            if i == n or argv[i].startswith("-"):
+                return None
+            ns[tok[2:]] = argv[i]
+            i += 1
+        elif tok in ("--box", "--cell"):
+            j = i
+            while j < n and not argv[j].startswith("-"):
+                j += 1
+            try:
+                vals = [int(v) for v in argv[i:j]]
+            except ValueError:
+                return None
+            if not vals or (tok == "--cell" and len(vals) != 2):
+                return None
+            ns[tok[2:]] = vals
+            i = j
+        else:
+            ns[tok[2:]] = True
+
+    if cmd == "share" and ns["type"] not in _SHARE_LINK_BUILDERS:
+        return None
+    for group in _FAST_EXCLUSIVE:
+        if len(seen.intersection(group)) > 1:
+            return None
+
+    func = {"list": cmd_list, "share": cmd_share, "reveal": cmd_reveal}[cmd]
+    return SimpleNamespace(cmd=cmd, func=func, **ns)
+
+
+def build_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When `argv` names a subcommand, only that subparser is constructed; otherwise
+    (no args, `--help`, a typo) all of them are, so help and errors list every command.
+    """
+    import argparse
+
+    p = argparse.ArgumentParser(prog="sudoku.py")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    name = _sniff_subcommand(sys.argv[1:] if argv is None else argv)
+    if name is not None:
+        _SUBCOMMAND_BUILDERS[name](sub)
+    else:
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(sub)
 
     return p
 
 
 def main(argv: Optional[List[str]] = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
-    return int(args.func(args))
+    args = _fastpath(sys.argv[1:] if argv is None else argv)
+    if args is None:
+        args = build_parser(argv).parse_args(argv)
+    rc = args.func(args)
+    # Handlers return a plain 0; only coerce something else (e.g. a bool).
+    return rc if type(rc) is int else int(rc)
 
 
 if __name__ == "__main__":
@@ -12,13 +12,11 @@ Examples:
     ./sudoku_fetcher.py https://www.sudokuonline.io/kids/letters-4-4 --letters
 """
 
-import requests
 import re
 import random
 import sys
 import math
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
 
 # Default URL if none provided
 DEFAULT_URL = "https://www.sudokuonline.io/kids/numbers-6-6"
@@ -72,6 +70,8 @@ def _extract_js_array_contents(html, var_name):
 
 def fetch_puzzles(url):
     """Fetch preloaded puzzles from the given URL."""
+    import requests
+
     try:
         response = requests.get(url)
         response.raise_for_status()
@@ -201,10 +201,19 @@ def generate_scl_link(grid, size, title="Sudoku", author="Sudoku Skill"):
     link = f"https://sudokupad.app/scl{b64}"
     return link
 
-import lzstring as _lzstring
 import urllib.parse
 
-_lz = _lzstring.LZString()
+_lz = None
+
+
+def _lz_codec():
+    """LZString codec, imported on first use (only the SudokuPad links need it)."""
+    global _lz
+    if _lz is None:
+        import lzstring
+
+        _lz = lzstring.LZString()
+    return _lz
 
 # SudokuPad classic compact codec (zipClassicSudoku2)
 _BLANK_ENCODES = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwx"
@@ -243,9 +252,10 @@ def generate_puzzle_link(grid, size, title="Sudoku", author="Sudoku Skill"):
         "metadata": {"title": title, "author": author},
     }
     json_str = json.dumps(scl_obj, separators=(',', ':'))
+    lz = _lz_codec()
 
     try:
-        encoded = _lz.compressToEncodedURIComponent(json_str)
+        encoded = lz.compressToEncodedURIComponent(json_str)
         return f"https://sudokupad.svencodes.com/puzzle/{encoded}"
     except Exception as e:
         return f"Error generating puzzle link: {e}"
@@ -272,10 +282,11 @@ def generate_native_link(grid, size, title="Sudoku"):
 
     _BASE = "https://sudokupad.svencodes.com/puzzle/"
     _MAX_URL = 251  # iOS SudokuPad universal link length limit
+    lz = _lz_codec()
 
     try:
         payload = json.dumps(wrapper, separators=(',', ':'), ensure_ascii=False)
-        blob = _lz.compressToBase64(payload)
+        blob = lz.compressToBase64(payload)
         # Strip '=' padding — iOS import path rejects it.
         blob = blob.rstrip('=')
         # Encode '/' to keep payload as single path segment.
@@ -284,7 +295,7 @@ def generate_native_link(grid, size, title="Sudoku"):
         if len(url) > _MAX_URL:
             # Fallback: drop message entirely to shorten
             payload = json.dumps({"p": p, "n": title}, separators=(',', ':'), ensure_ascii=False)
-            blob = _lz.compressToBase64(payload).rstrip('=').replace('/', '%2F')
+            blob = lz.compressToBase64(payload).rstrip('=').replace('/', '%2F')
             url = f"{_BASE}{blob}"
         return url
     except Exception as e:
@@ -357,6 +368,7 @@ def render_sudoku(
 
     Note: If a title or extra_lines are provided, they are rendered in an area *above* the grid.
     """
+    from PIL import Image, ImageDraw, ImageFont
 
     cell_size = RENDER_CELL_SIZE
     outer_w = RENDER_OUTER_LINE_WIDTH
@@ -528,7 +540,7 @@ def main():
         link_fp = generate_fpuzzles_link(clues, size, title=f"Sudoku {size}x{size}")
         print(f"\n🔗 SudokuPad Link (F-Puzzles Fallback):\n{link_fp}\n")
         
-        short_id = str(puzzle['id']).split('-')[0]
+        short_id = str(puzzle['id']).partition('-')[0]
         link_native = generate_native_link(clues, size, title=f"Sudoku {size}x{size} [{short_id}]")
         print(f"\n🔗 SudokuPad Link (Native Short Share):\n{link_native}\n")
     except Exception as e: